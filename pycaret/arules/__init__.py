@@ -63,12 +63,9 @@ def setup(data, transaction_id, item_id, ignore_items=None, session_id=None):
 
     """
 
-    # exception checking
-    import sys
-
     # checking data type
     if hasattr(data, "shape") is False:
-        sys.exit("(Type Error): data passed must be of type pandas.DataFrame")
+        raise TypeError("data passed must be of type pandas.DataFrame")
 
     # ignore warnings
     warnings.filterwarnings("ignore")
@@ -1698,6 +1698,7 @@ def plot_model(
     plot_kwargs: dict, default = {} (empty dict)
         Dictionary of arguments passed to the visualizer class.
             - pipeline: fontsize -> int
+            - learning: train_sizes -> array-like
 
 
     groups: str or array-like, with shape (n_samples,), default = None
@@ -7,7 +7,6 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np  # type: ignore
 import pandas as pd
-import plotly.express as px
 import sklearn
 from joblib.memory import Memory
 
@@ -32,12 +31,7 @@ from pycaret.internal.pycaret_experiment.non_ts_supervised_experiment import (
 from pycaret.internal.validation import is_sklearn_cv_generator
 from pycaret.loggers.base_logger import BaseLogger
 from pycaret.utils.constants import DATAFRAME_LIKE, SEQUENCE_LIKE, TARGET_LIKE
-from pycaret.utils.generic import (
-    MLUsecase,
-    get_classification_task,
-    get_label_encoder,
-    highlight_setup,
-)
+from pycaret.utils.generic import MLUsecase, get_classification_task, get_label_encoder
 
 LOGGER = get_logger()
 
@@ -77,16 +71,10 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
         }
 
     def _get_models(self, raise_errors: bool = True) -> Tuple[dict, dict]:
-        all_models = {
-            k: v
-            for k, v in get_all_class_model_containers(
-                self, raise_errors=raise_errors
-            ).items()
-            if not v.is_special
-        }
         all_models_internal = get_all_class_model_containers(
             self, raise_errors=raise_errors
         )
+        all_models = {k: v for k, v in all_models_internal.items() if not v.is_special}
         return all_models, all_models_internal
 
     def _get_metrics(self, raise_errors: bool = True) -> dict:
@@ -742,6 +730,35 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
                         f"are: {', '.join(self._available_plots.keys())}."
                     )
 
+        # Validate the string options before touching the data
+        fold_strategy = self._check_setup_param("fold_strategy", fold_strategy)
+        if preprocess:
+            imputation_type = self._check_setup_param(
+                "imputation_type", imputation_type
+            )
+            if imputation_type == "simple":
+                numeric_imputation = self._check_setup_param(
+                    "numeric_imputation", numeric_imputation
+                )
+            if transformation:
+                transformation_method = self._check_setup_param(
+                    "transformation_method", transformation_method
+                )
+            if normalize:
+                normalize_method = self._check_setup_param(
+                    "normalize_method", normalize_method
+                )
+            if pca:
+                pca_method = self._check_setup_param("pca_method", pca_method)
+            if remove_outliers:
+                outliers_method = self._check_setup_param(
+                    "outliers_method", outliers_method
+                )
+            if feature_selection:
+                feature_selection_method = self._check_setup_param(
+                    "feature_selection_method", feature_selection_method
+                )
+
         # Set up data ============================================== >>
         if data_func is not None:
             data = data_func()
@@ -814,11 +831,6 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
                     numeric_iterative_imputer=numeric_iterative_imputer,
                     categorical_iterative_imputer=categorical_iterative_imputer,
                 )
-            elif imputation_type is not None:
-                raise ValueError(
-                    "Invalid value for the imputation_type parameter, got "
-                    f"{imputation_type}. Possible values are: simple, iterative."
-                )
 
             # Convert text features to meaningful vectors
             if self._fxs["Text"]:
@@ -898,6 +910,10 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
 
         self.logger.info("Creating final display dataframe.")
 
+        # Transform every set only once (dataset = train + test)
+        train_transformed = self.train_transformed
+        test_transformed = self.test_transformed
+
         container = []
         container.append(["Session id", self.seed])
         container.append(["Target", self.target_param])
@@ -909,14 +925,23 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
                 ["Target mapping", ", ".join([f"{k}: {v}" for k, v in mapping.items()])]
             )
         container.append(["Original data shape", self.data.shape])
-        container.append(["Transformed data shape", self.dataset_transformed.shape])
-        container.append(["Transformed train set shape", self.train_transformed.shape])
-        container.append(["Transformed test set shape", self.test_transformed.shape])
+        container.append(
+            [
+                "Transformed data shape",
+                (
+                    len(train_transformed) + len(test_transformed),
+                    train_transformed.shape[1],
+                ),
+            ]
+        )
+        container.append(["Transformed train set shape", train_transformed.shape])
+        container.append(["Transformed test set shape", test_transformed.shape])
         for fx, cols in self._fxs.items():
             if len(cols) > 0:
                 container.append([f"{fx} features", len(cols)])
-        if self.data.isna().sum().sum():
-            n_nans = 100 * self.data.isna().any(axis=1).sum() / len(self.data)
+        rows_with_nans = self.data.isna().to_numpy().any(axis=1)
+        if rows_with_nans.any():
+            n_nans = 100 * rows_with_nans.mean()
             container.append(["Rows with missing values", f"{round(n_nans, 1)}%"])
         if preprocess:
             container.append(["Preprocess", preprocess])
@@ -990,18 +1015,7 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
             container.append(["Experiment Name", self.exp_name_log])
             container.append(["USI", self.USI])
 
-        self._display_container = [
-            pd.DataFrame(container, columns=["Description", "Value"])
-        ]
-        self.logger.info(f"Setup _display_container: {self._display_container[0]}")
-        display = CommonDisplay(
-            verbose=self.verbose,
-            html_param=self.html_param,
-        )
-        if self.verbose:
-            pd.set_option("display.max_rows", 100)
-            display.display(self._display_container[0].style.apply(highlight_setup))
-            pd.reset_option("display.max_rows")  # Reset option
+        self._display_setup(container)
 
         # Wrap-up ================================================== >>
 
@@ -2043,6 +2057,7 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
         plot_kwargs: dict, default = {} (empty dict)
             Dictionary of arguments passed to the visualizer class.
                 - pipeline: fontsize -> int
+                - learning: train_sizes -> array-like
 
 
         groups: str or array-like, with shape (n_samples,), default = None
@@ -2482,11 +2497,18 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
         self.logger.info("Importing untrained CalibratedClassifierCV")
 
         calibrated_model_definition = self._all_models_internal["CalibratedCV"]
+        calibrated_args = dict(calibrated_model_definition.args)
+
+        # keep the calibration folds serial when the base model is itself
+        # multi-threaded
+        if getattr(estimator, "n_jobs", None) not in (None, 1):
+            calibrated_args["n_jobs"] = 1
+
         model = calibrated_model_definition.class_def(
             base_estimator=estimator,
             method=method,
             cv=calibrate_fold,
-            **calibrated_model_definition.args,
+            **calibrated_args,
         )
 
         display.move_progress()
@@ -2721,6 +2743,8 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
 
         self.logger.info("plotting optimization threshold using plotly")
 
+        import plotly.express as px
+
         title = f"{model_name} Probability Threshold Optimization (default = 0.5)"
         plot_kwargs = plot_kwargs or {}
         fig = px.line(
@@ -3453,10 +3477,8 @@ class ClassificationExperiment(_NonTSSupervisedExperiment, Preprocessor):
 
         # Replaceing chars which dash doesnt accept for column name `.` , `{`, `}`
         X_test_df = self.X_test_transformed.copy()
-        X_test_df.columns = [
-            col.replace(".", "__").replace("{", "__").replace("}", "__")
-            for col in X_test_df.columns
-        ]
+        table = str.maketrans({".": "__", "{": "__", "}": "__"})
+        X_test_df.columns = [col.translate(table) for col in X_test_df.columns]
         explainer = ClassifierExplainer(
             estimator, X_test_df, self.y_test_transformed, labels=labels_, **kwargs
         )
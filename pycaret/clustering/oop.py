@@ -34,16 +34,10 @@ class ClusteringExperiment(_UnsupervisedExperiment):
         }
 
     def _get_models(self, raise_errors: bool = True) -> Tuple[dict, dict]:
-        all_models = {
-            k: v
-            for k, v in get_all_clust_model_containers(
-                self, raise_errors=raise_errors
-            ).items()
-            if not v.is_special
-        }
         all_models_internal = get_all_clust_model_containers(
             self, raise_errors=raise_errors
         )
+        all_models = {k: v for k, v in all_models_internal.items() if not v.is_special}
         return all_models, all_models_internal
 
     def _get_metrics(self, raise_errors: bool = True) -> dict:
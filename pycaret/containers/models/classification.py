@@ -1523,7 +1523,7 @@ class BaggingClassifierContainer(ClassifierContainer):
 
         args = {
             "random_state": experiment.seed,
-            "n_jobs": 1 if experiment.gpu_param else None,
+            "n_jobs": 1 if experiment.gpu_param else experiment.n_jobs_param,
         }
         tune_args = {}
         tune_grid = {
@@ -1619,7 +1619,7 @@ class CalibratedClassifierCVContainer(ClassifierContainer):
         np.random.seed(experiment.seed)
         from sklearn.calibration import CalibratedClassifierCV
 
-        args = {}
+        args = {"n_jobs": 1 if experiment.gpu_param else experiment.n_jobs_param}
         tune_args = {}
         tune_grid = {}
         tune_distributions = {}
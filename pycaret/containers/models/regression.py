@@ -1906,7 +1906,7 @@ class BaggingRegressorContainer(RegressorContainer):
 
         args = {
             "random_state": experiment.seed,
-            "n_jobs": 1 if experiment.gpu_param else None,
+            "n_jobs": 1 if experiment.gpu_param else experiment.n_jobs_param,
         }
         tune_args = {"strategy": ["mean", "median"]}
         tune_grid = {
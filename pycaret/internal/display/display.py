@@ -36,7 +36,9 @@ class CommonDisplay:
     def display(self, df, *, clear: bool = False, final_display: bool = True):
         if not self.can_display:
             return
-        if clear:
+        # Displaying an object updates the current display in place, so
+        # clearing it first would only cost an extra frontend round-trip
+        if clear and df is None:
             self._general_display.clear_display()
         if final_display:
             self.close()
@@ -80,7 +82,9 @@ class CommonDisplay:
 
         backend_id = "cli" if html_param is False else None
 
-        if monitor_rows:
+        # Silent displays never render the monitor or the progress bar, so
+        # don't build them (and their frames / backends) at all
+        if monitor_rows and self.verbose:
             self._monitor_display = MonitorDisplay(
                 monitor_rows, backend=backend_id, verbose=self.verbose
             )
@@ -93,7 +97,7 @@ class CommonDisplay:
         )
         self._general_display.display(None)
 
-        if progress_args:
+        if progress_args and self.verbose:
             self._progress_bar_display = ProgressBarDisplay(
                 **progress_args, backend=backend_id, verbose=self.verbose
             )
@@ -58,5 +58,14 @@ class MonitorDisplay(DisplayComponent):
         self.backend.display(self.monitor)
 
     def update(self, row_idx: int, message: str):
-        self.monitor.iloc[row_idx, 1:] = str(message)
+        # Nothing is rendered outside of rich frontends (CLI, scripts,
+        # verbose=False), so skip writing to the monitor frame entirely
+        if isinstance(self.backend, SilentBackend):
+            return
+        message = str(message)
+        # Every render serializes the whole frame to the frontend, so skip
+        # updates that would not change what is shown
+        if (self.monitor.iloc[row_idx, 1:] == message).all():
+            return
+        self.monitor.iloc[row_idx, 1:] = message
         self.display()
@@ -0,0 +1,40 @@
+import tqdm.notebook
+
+from pycaret.internal.display.display_backend import DisplayBackend
+
+
+class CustomDisplayNotebookTqdm(tqdm.notebook.tqdm):
+    def __init__(self, *args, **kwargs):
+        self.display_backend: DisplayBackend = kwargs.pop("display_backend")
+        super().__init__(*args, **kwargs)
+
+    def display(
+        self, msg=None, pos=None, close=False, bar_style=None, check_delay=True
+    ):
+        # trick tqdm into doing all the updating without displaying in its own display
+        original_displayed = self.displayed
+        self.displayed = True
+        _, pbar, _ = self.container.children
+        super().display(msg, pos, close, bar_style, check_delay)
+        self.displayed = original_displayed
+        if check_delay and self.delay > 0 and not self.displayed:
+            self.display_backend.display(self.container)
+            self.displayed = True
+
+        if close:
+            try:
+                self.container.close()
+            except AttributeError:
+                self.container.visible = False
+            self.display_backend.clear_display()
+
+    def close(self):
+        if self.disable:
+            return
+        super().close()
+        # Try to detect if there was an error or KeyboardInterrupt
+        # in manual mode: if n < total, things probably got wrong
+        if self.leave:
+            self.disp(bar_style="success", check_delay=False)
+        else:
+            self.disp(close=True, check_delay=False)
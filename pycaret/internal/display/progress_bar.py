@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Union
 
-import tqdm.notebook
 import tqdm.std
 
 from pycaret.internal.display.display_backend import (
@@ -56,45 +55,12 @@ class CLIProgressBarBackend(ProgressBarBackend):
         )
 
 
-class CustomDisplayNotebookTqdm(tqdm.notebook.tqdm):
-    def __init__(self, *args, **kwargs):
-        self.display_backend: DisplayBackend = kwargs.pop("display_backend")
-        super().__init__(*args, **kwargs)
-
-    def display(
-        self, msg=None, pos=None, close=False, bar_style=None, check_delay=True
-    ):
-        # trick tqdm into doing all the updating without displaying in its own display
-        original_displayed = self.displayed
-        self.displayed = True
-        _, pbar, _ = self.container.children
-        super().display(msg, pos, close, bar_style, check_delay)
-        self.displayed = original_displayed
-        if check_delay and self.delay > 0 and not self.displayed:
-            self.display_backend.display(self.container)
-            self.displayed = True
-
-        if close:
-            try:
-                self.container.close()
-            except AttributeError:
-                self.container.visible = False
-            self.display_backend.clear_display()
-
-    def close(self):
-        if self.disable:
-            return
-        super().close()
-        # Try to detect if there was an error or KeyboardInterrupt
-        # in manual mode: if n < total, things probably got wrong
-        if self.leave:
-            self.disp(bar_style="success", check_delay=False)
-        else:
-            self.disp(close=True, check_delay=False)
-
-
 class JupyterProgressBarBackend(ProgressBarBackend):
     def open(self):
+        # tqdm.notebook pulls in ipywidgets, so only import it once a
+        # notebook progress bar is actually shown
+        from pycaret.internal.display.notebook_tqdm import CustomDisplayNotebookTqdm
+
         self._pbar = CustomDisplayNotebookTqdm(
             desc=self.description,
             total=self.max,
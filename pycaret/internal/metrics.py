@@ -1,5 +1,13 @@
+from typing import Callable, Dict, Union
+
 import numpy as np
-from sklearn.metrics._scorer import _PredictScorer, _ProbaScorer, _ThresholdScorer
+from sklearn.metrics._scorer import (
+    _check_multimetric_scoring,
+    _MultimetricScorer,
+    _PredictScorer,
+    _ProbaScorer,
+    _ThresholdScorer,
+)
 
 
 class BinaryMulticlassScoreFunc:
@@ -250,3 +258,46 @@ def make_scorer_with_error_score(
     else:
         cls = _PredictScorerWithErrorScore
     return cls(score_func, sign, kwargs, error_score)
+
+
+class _CachedMultimetricScorer(_MultimetricScorer):
+    """Multimetric scorer that always shares predictions between scorers.
+
+    sklearn only caches ``predict``/``predict_proba`` calls when it counts
+    several scorers of the exact same built-in type, so the ``*WithErrorScore``
+    scorers above (and custom metrics) each trigger their own prediction.
+
+    This relies on the private ``_MultimetricScorer(**scorers)`` signature,
+    which only holds for the ``scikit-learn<1.2`` pin in requirements.txt
+    (1.3 changed it to ``scorers=..., raise_exc=...``).
+    """
+
+    def _use_cache(self, estimator):
+        return len(self._scorers) > 1
+
+
+def get_multimetric_scorer(
+    estimator, scoring: dict
+) -> Union[_MultimetricScorer, Dict[str, Callable]]:
+    """Build a scorer for ``cross_validate`` that predicts once per fold.
+
+    Parameters
+    ----------
+    estimator : object
+        Estimator used to resolve string scorers.
+
+    scoring : dict
+        Mapping of metric names to scorers (or sklearn scorer names).
+
+    Returns
+    -------
+    scorer : callable or dict
+        Callable returning a dict of scores, one per metric. If the private
+        sklearn scorer can not be built, the dict of scorers is returned so
+        ``cross_validate`` scores each metric on its own.
+    """
+    scorers = _check_multimetric_scoring(estimator, scoring)
+    try:
+        return _CachedMultimetricScorer(**scorers)
+    except TypeError:
+        return scorers
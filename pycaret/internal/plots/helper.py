@@ -2,8 +2,8 @@
 This module contains methods that can be used in various plot modules and don't really belong to a specific module
 """
 
+import matplotlib.pyplot as plt
 import numpy as np
-import scikitplot as skplt
 
 
 def leverage_statistic(x: np.ndarray):
@@ -27,8 +27,8 @@ def leverage_statistic(x: np.ndarray):
         x = x.reshape(x.shape[0], 1)
 
     cov_mat_inv = np.linalg.inv(x.T.dot(x))
-    H = x.dot(cov_mat_inv.dot(x.T))
-    leverage = H.diagonal()
+    # Only the diagonal of H is needed, skip the (n, n) matrix product
+    leverage = np.sum(x.dot(cov_mat_inv) * x, axis=1)
     return leverage
 
 
@@ -110,7 +110,8 @@ def cooks_distance(
 
     """
     p = n_model_params if n_model_params is not None and n_model_params >= 1 else 1
-    multiplier = [element / (1 - element) for element in leverage_statistic]
+    leverage_statistic = np.asarray(leverage_statistic)
+    multiplier = leverage_statistic / (1 - leverage_statistic)
     distance = np.multiply(np.power(standardized_residuals, 2) / (p + 1), multiplier)
     return distance
 
@@ -118,8 +119,8 @@ def cooks_distance(
 class MatplotlibDefaultDPI(object):
     def __init__(self, base_dpi: float = 100, scale_to_set: float = 1):
         try:
-            self.default_skplt_dpit = skplt.metrics.plt.rcParams["figure.dpi"]
-            skplt.metrics.plt.rcParams["figure.dpi"] = base_dpi * scale_to_set
+            self.default_skplt_dpit = plt.rcParams["figure.dpi"]
+            plt.rcParams["figure.dpi"] = base_dpi * scale_to_set
         except Exception:
             pass
 
@@ -128,6 +129,6 @@ class MatplotlibDefaultDPI(object):
 
     def __exit__(self, type, value, traceback):
         try:
-            skplt.metrics.plt.rcParams["figure.dpi"] = self.default_skplt_dpit
+            plt.rcParams["figure.dpi"] = self.default_skplt_dpit
         except Exception:
             pass
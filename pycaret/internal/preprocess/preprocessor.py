@@ -1,7 +1,7 @@
 # Author: Mavs (m.524687@gmail.com)
 # License: MIT
 
-from copy import deepcopy
+from functools import partial
 
 import numpy as np
 import pandas as pd
@@ -91,10 +91,61 @@ from pycaret.utils.generic import (
     to_series,
 )
 
+# Estimators selected by the normalize_method and pca_method options
+NORMALIZE_METHODS = {
+    "zscore": StandardScaler,
+    "minmax": MinMaxScaler,
+    "maxabs": MaxAbsScaler,
+    "robust": RobustScaler,
+}
+PCA_METHODS = {
+    "linear": PCA,
+    "kernel": partial(KernelPCA, kernel="rbf"),
+    "incremental": IncrementalPCA,
+}
+
+# Allowed values for the string options of setup, validated before any
+# data is processed so that typos fail fast instead of after the split
+ALLOWED_SETUP_OPTIONS = {
+    "fold_strategy": frozenset(
+        ("kfold", "stratifiedkfold", "groupkfold", "timeseries")
+    ),
+    "imputation_type": frozenset(("simple", "iterative")),
+    "numeric_imputation": frozenset(("drop", "mean", "median", "mode", "knn")),
+    "transform_target_method": frozenset(("quantile", "yeo-johnson")),
+    "transformation_method": frozenset(("quantile", "yeo-johnson")),
+    "normalize_method": frozenset(NORMALIZE_METHODS),
+    "pca_method": frozenset(PCA_METHODS),
+    "outliers_method": frozenset(("iforest", "ee", "lof")),
+    "feature_selection_method": frozenset(("classic", "univariate", "sequential")),
+}
+
 
 class Preprocessor:
     """Class for all standard transformation steps."""
 
+    def _check_setup_param(self, name, value, allowed=None):
+        """Validate a string option of setup and return it in lower case.
+
+        The lower-cased value is what setup passes on, so the
+        preprocessing steps receive the spelling that was validated.
+        Values that are None or not a string (e.g. a custom estimator
+        or a fill value) are returned unchanged and left to the
+        corresponding preprocessing step.
+
+        """
+        if not isinstance(value, str):
+            return value
+
+        allowed = allowed or ALLOWED_SETUP_OPTIONS[name]
+        if value.lower() not in allowed:
+            raise ValueError(
+                f"Invalid value for the {name} parameter, got {value}. "
+                f"Choose from: {', '.join(sorted(allowed))}."
+            )
+
+        return value.lower()
+
     def _prepare_dataset(self, X, y=None):
         """Prepare the input data.
 
@@ -116,8 +167,10 @@ class Preprocessor:
         """
         self.logger.info("Set up data.")
 
-        # Make copy to not overwrite mutable arguments
-        X = to_df(deepcopy(X))
+        # No need to copy the input here. Every branch below returns a
+        # new dataframe (drop/merge/astype), so the caller's data is never
+        # modified and no full duplicate is kept in memory
+        X = to_df(X)
 
         # Prepare target column
         if isinstance(y, (list, tuple, np.ndarray, pd.Series)):
@@ -220,17 +273,24 @@ class Preprocessor:
                     )
                 self.data.index = self.index
 
-            # self.data is already prepared here
+            # Only materialize the feature set when it's needed to stratify
+            if data_split_stratify:
+                stratify = get_columns_to_stratify_by(
+                    self.X, self.y, data_split_stratify
+                ).to_numpy()
+            else:
+                stratify = None
+
+            # self.data is already prepared here. Split the row positions
+            # only, so the dataframe is reordered with a single gather
             train, test = train_test_split(
-                self.data,
+                np.arange(len(self.data)),
                 train_size=train_size,
-                stratify=get_columns_to_stratify_by(
-                    self.X, self.y, data_split_stratify
-                ),
+                stratify=stratify,
                 random_state=self.seed,
                 shuffle=data_split_shuffle,
             )
-            self.data = self._set_index(pd.concat([train, test]))
+            self.data = self._set_index(self.data.iloc[np.concatenate([train, test])])
             self.idx = [self.data.index[: len(train)], self.data.index[-len(test) :]]
 
         else:  # test_data is provided
@@ -268,43 +328,48 @@ class Preprocessor:
         # Features to be ignored (are not read by self.dataset, self.X, etc...)
         self._fxs["Ignore"] = ignore_features or []
 
+        X = self.X  # Avoid dropping the target column at every access
+
+        # Zero-row view of X: select_dtypes only needs the schema and
+        # would otherwise copy the data of every matching column
+        schema = X.iloc[:0]
+
         # Ordinal features
         if ordinal_features:
-            check_features_exist(ordinal_features.keys(), self.X)
+            check_features_exist(ordinal_features.keys(), X)
             self._fxs["Ordinal"] = ordinal_features
         else:
             self._fxs["Ordinal"] = {}
 
         # Numerical features
         if numeric_features:
-            check_features_exist(numeric_features, self.X)
+            check_features_exist(numeric_features, X)
             self._fxs["Numeric"] = numeric_features
         else:
-            self._fxs["Numeric"] = list(self.X.select_dtypes(include="number").columns)
+            self._fxs["Numeric"] = list(schema.select_dtypes(include="number").columns)
 
         # Date features
         if date_features:
-            check_features_exist(date_features, self.X)
+            check_features_exist(date_features, X)
             self._fxs["Date"] = date_features
         else:
-            self._fxs["Date"] = list(self.X.select_dtypes(include="datetime").columns)
+            self._fxs["Date"] = list(schema.select_dtypes(include="datetime").columns)
 
         # Text features
         if text_features:
-            check_features_exist(text_features, self.X)
+            check_features_exist(text_features, X)
             self._fxs["Text"] = text_features
 
         # Categorical features
         if categorical_features:
-            check_features_exist(categorical_features, self.X)
+            check_features_exist(categorical_features, X)
             self._fxs["Categorical"] = categorical_features
         else:
             # Default should exclude datetime and text columns
-            self._fxs["Categorical"] = [
-                col
-                for col in self.X.select_dtypes(include=["object", "category"]).columns
-                if col not in self._fxs["Date"] + self._fxs["Text"]
-            ]
+            cat_cols = schema.select_dtypes(include=["object", "category"]).columns
+            self._fxs["Categorical"] = list(
+                cat_cols[~cat_cols.isin(self._fxs["Date"] + self._fxs["Text"])]
+            )
 
         # Features to keep during all preprocessing
         self._fxs["Keep"] = keep_features or []
@@ -312,7 +377,6 @@ class Preprocessor:
     def _prepare_folds(self, fold_strategy, fold, fold_shuffle, fold_groups):
         """Assign the fold strategy."""
         self.logger.info("Set up folding strategy.")
-        allowed_fold_strategy = ["kfold", "stratifiedkfold", "groupkfold", "timeseries"]
 
         if isinstance(fold_strategy, str):
             if fold_strategy == "groupkfold":
@@ -321,10 +385,10 @@ class Preprocessor:
                         "Invalid value for the fold_strategy parameter. 'groupkfold' "
                         "requires 'fold_groups' to be a non-empty array-like object."
                     )
-            elif fold_strategy not in allowed_fold_strategy:
+            elif fold_strategy not in ALLOWED_SETUP_OPTIONS["fold_strategy"]:
                 raise ValueError(
-                    "Invalid value for the fold_strategy parameter. "
-                    f"Choose from: {', '.join(allowed_fold_strategy)}."
+                    "Invalid value for the fold_strategy parameter. Choose from: "
+                    f"{', '.join(sorted(ALLOWED_SETUP_OPTIONS['fold_strategy']))}."
                 )
 
         if fold_strategy == "timeseries" or isinstance(fold_strategy, TimeSeriesSplit):
@@ -395,9 +459,9 @@ class Preprocessor:
             )
         else:
             raise ValueError(
-                "Invalid value for the transform_target_method parameter. "
-                "The value should be either yeo-johnson or quantile, "
-                f"got {transformation_method}."
+                "Invalid value for the transform_target_method parameter, got "
+                f"{transformation_method}. Choose from: "
+                f"{', '.join(sorted(ALLOWED_SETUP_OPTIONS['transform_target_method']))}."
             )
 
         self.pipeline.steps.append(
@@ -444,7 +508,8 @@ class Preprocessor:
             else:
                 raise ValueError(
                     "Invalid value for the numeric_imputation parameter, got "
-                    f"{numeric_imputation}. Choose from: drop, mean, median, mode, knn."
+                    f"{numeric_imputation}. Choose from: "
+                    f"{', '.join(sorted(ALLOWED_SETUP_OPTIONS['numeric_imputation']))}."
                 )
         else:
             num_estimator = TransformerWrapper(
@@ -797,11 +862,11 @@ class Preprocessor:
         """Remove outliers from the dataset."""
         self.logger.info("Set up removing outliers.")
 
-        if outliers_method.lower() not in ("iforest", "ee", "lof"):
+        if outliers_method.lower() not in ALLOWED_SETUP_OPTIONS["outliers_method"]:
             raise ValueError(
-                "Invalid value for the outliers_method parameter, "
-                f"got {outliers_method}. Possible values are: "
-                "'iforest', 'ee' or 'lof'."
+                "Invalid value for the outliers_method parameter, got "
+                f"{outliers_method}. Choose from: "
+                f"{', '.join(sorted(ALLOWED_SETUP_OPTIONS['outliers_method']))}."
             )
 
         outliers = TransformerWrapper(
@@ -875,9 +940,9 @@ class Preprocessor:
             )
         else:
             raise ValueError(
-                "Invalid value for the transformation_method parameter. "
-                "The value should be either yeo-johnson or quantile, "
-                f"got {transformation_method}."
+                "Invalid value for the transformation_method parameter, got "
+                f"{transformation_method}. Choose from: "
+                f"{', '.join(sorted(ALLOWED_SETUP_OPTIONS['transformation_method']))}."
             )
 
         self.pipeline.steps.append(
@@ -888,18 +953,15 @@ class Preprocessor:
         """Scale the features."""
         self.logger.info("Set up feature normalization.")
 
-        norm_dict = {
-            "zscore": StandardScaler(),
-            "minmax": MinMaxScaler(),
-            "maxabs": MaxAbsScaler(),
-            "robust": RobustScaler(),
-        }
-        if normalize_method in norm_dict:
-            normalize_estimator = TransformerWrapper(norm_dict[normalize_method])
+        if normalize_method in NORMALIZE_METHODS:
+            normalize_estimator = TransformerWrapper(
+                NORMALIZE_METHODS[normalize_method]()
+            )
         else:
             raise ValueError(
                 "Invalid value for the normalize_method parameter, got "
-                f"{normalize_method}. Possible values are: {' '.join(norm_dict)}."
+                f"{normalize_method}. Choose from: "
+                f"{', '.join(sorted(ALLOWED_SETUP_OPTIONS['normalize_method']))}."
             )
 
         self.pipeline.steps.append(("normalize", normalize_estimator))
@@ -908,20 +970,16 @@ class Preprocessor:
         """Apply Principal Component Analysis."""
         self.logger.info("Set up PCA.")
 
-        pca_dict = {
-            "linear": PCA(n_components=pca_components),
-            "kernel": KernelPCA(n_components=pca_components, kernel="rbf"),
-            "incremental": IncrementalPCA(n_components=pca_components),
-        }
-        if pca_method in pca_dict:
+        if pca_method in PCA_METHODS:
             pca_estimator = TransformerWrapper(
-                transformer=pca_dict[pca_method],
+                transformer=PCA_METHODS[pca_method](n_components=pca_components),
                 exclude=self._fxs["Keep"],
             )
         else:
             raise ValueError(
                 "Invalid value for the pca_method parameter, got "
-                f"{pca_method}. Possible values are: {' '.join(pca_dict)}."
+                f"{pca_method}. Choose from: "
+                f"{', '.join(sorted(ALLOWED_SETUP_OPTIONS['pca_method']))}."
             )
 
         self.pipeline.steps.append(("pca", pca_estimator))
@@ -992,9 +1050,9 @@ class Preprocessor:
             )
         else:
             raise ValueError(
-                "Invalid value for the feature_selection_method parameter, "
-                f"got {feature_selection_method}. Possible values are: "
-                "'classic', 'univariate' or 'sequential'."
+                "Invalid value for the feature_selection_method parameter, got "
+                f"{feature_selection_method}. Choose from: "
+                f"{', '.join(sorted(ALLOWED_SETUP_OPTIONS['feature_selection_method']))}."
             )
 
         self.pipeline.steps.append(("feature_selection", feature_selector))
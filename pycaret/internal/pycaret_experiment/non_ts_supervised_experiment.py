@@ -9,10 +9,19 @@ class _NonTSSupervisedExperiment(_SupervisedExperiment):
     def __init__(self) -> None:
         super().__init__()
 
+    @property
+    def _feature_columns(self) -> list:
+        """Columns of the feature set, in dataset order."""
+        return [
+            c
+            for c in self.data.columns
+            if c != self.target_param and c not in self._fxs["Ignore"]
+        ]
+
     @property
     def X(self):
         """Feature set."""
-        return self.dataset.drop(self.target_param, axis=1)
+        return self.data.loc[:, self._feature_columns]
 
     @property
     def dataset_transformed(self):
@@ -31,8 +40,13 @@ class _NonTSSupervisedExperiment(_SupervisedExperiment):
     @property
     def train_transformed(self):
         """Transformed training set."""
+        # Single pass through the pipeline for both X and y
         return pd.concat(
-            [self.X_train_transformed, self.y_train_transformed],
+            self.pipeline.transform(
+                X=self.X_train,
+                y=self.y_train,
+                filter_train_only=False,
+            ),
             axis=1,
         )
 
@@ -44,12 +58,12 @@ class _NonTSSupervisedExperiment(_SupervisedExperiment):
     @property
     def X_train(self):
         """Feature set of the training set."""
-        return self.train.drop(self.target_param, axis=1)
+        return self.data.loc[self.idx[0], self._feature_columns]
 
     @property
     def X_test(self):
         """Feature set of the test set."""
-        return self.test.drop(self.target_param, axis=1)
+        return self.data.loc[self.idx[1], self._feature_columns]
 
     @property
     def test(self):
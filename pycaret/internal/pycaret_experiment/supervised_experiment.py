@@ -1,6 +1,8 @@
 import datetime
 import gc
+import logging
 import os
+import secrets
 import time
 import traceback
 import warnings
@@ -15,6 +17,7 @@ import numpy as np  # type: ignore
 import pandas as pd  # type ignore
 import pandas.io.formats.style
 from sklearn.base import clone  # type: ignore
+from sklearn.model_selection import cross_validate
 from sklearn.pipeline import Pipeline as skPipeline
 from sklearn.utils.validation import check_is_fitted as check_fitted
 
@@ -43,6 +46,7 @@ from pycaret.internal.meta_estimators import (
     CustomProbabilityThresholdClassifier,
     get_estimator_from_meta_estimator,
 )
+from pycaret.internal.metrics import get_multimetric_scorer
 from pycaret.internal.parallel.parallel_backend import ParallelBackend
 from pycaret.internal.pipeline import (
     Pipeline,
@@ -52,7 +56,11 @@ from pycaret.internal.pipeline import (
 )
 from pycaret.internal.pycaret_experiment.tabular_experiment import _TabularExperiment
 from pycaret.internal.tunable import TunableMixin
-from pycaret.internal.validation import is_fitted, is_sklearn_cv_generator
+from pycaret.internal.validation import (
+    PrecomputedSplits,
+    is_fitted,
+    is_sklearn_cv_generator,
+)
 from pycaret.utils._dependencies import _check_soft_dependencies
 from pycaret.utils.constants import DATAFRAME_LIKE, LABEL_COLUMN, SCORE_COLUMN
 from pycaret.utils.generic import (
@@ -299,6 +307,30 @@ class _SupervisedExperiment(_TabularExperiment):
         greater_is_worse_columns.add("TT (Sec)")
         return greater_is_worse_columns
 
+    def _build_master_display(
+        self,
+        model_rows: List[pd.DataFrame],
+        sort: str,
+        sort_ascending: bool,
+        round: int,
+        columns_to_ignore: List[str],
+    ) -> Tuple[pd.DataFrame, pandas.io.formats.style.Styler]:
+        """Concatenate the compare_models results gathered so far into the
+        sorted master table and its styled display version."""
+        master_display = pd.concat(model_rows).round(round)
+        if self._ml_usecase == MLUsecase.TIME_SERIES:
+            sort = sort.upper()
+        master_display = master_display.sort_values(by=sort, ascending=sort_ascending)
+
+        master_display_ = master_display.drop(
+            columns_to_ignore, axis=1, errors="ignore"
+        ).style.format(precision=round)
+        master_display_ = master_display_.set_properties(**{"text-align": "left"})
+        master_display_ = master_display_.set_table_styles(
+            [dict(selector="th", props=[("text-align", "left")])]
+        )
+        return master_display, master_display_
+
     def _highlight_models(self, master_display_: Any) -> Any:
         def highlight_max(s):
             to_highlight = s == s.max()
@@ -620,6 +652,11 @@ class _SupervisedExperiment(_TabularExperiment):
 
         groups = self._get_groups(groups)
 
+        if cross_validation and self._ml_usecase != MLUsecase.TIME_SERIES:
+            # Split once and evaluate every model on the same folds
+            data_X, data_y = self._create_model_get_train_X_y(None, None)
+            fold = PrecomputedSplits(fold, data_X, data_y, groups)
+
         pd.set_option("display.max_columns", 500)
 
         self.logger.info("Preparing display monitor")
@@ -703,7 +740,8 @@ class _SupervisedExperiment(_TabularExperiment):
             else:
                 model_library = list(self._all_models.keys())
             if exclude:
-                model_library = [x for x in model_library if x not in exclude]
+                excluded = set(exclude)
+                model_library = [x for x in model_library if x not in excluded]
 
         if self._ml_usecase == MLUsecase.TIME_SERIES:
             if "ensemble_forecaster" in model_library:
@@ -715,29 +753,24 @@ class _SupervisedExperiment(_TabularExperiment):
         display.move_progress()
 
         # create URI (before loop)
-        import secrets
-
         URI = secrets.token_hex(nbytes=4)
 
         master_display = None
         master_display_ = None
+        model_rows = []
+        results_columns_to_ignore = ["Object", "runtime", "cutoff"]
 
         total_runtime_start = time.time()
-        total_runtime = 0
         over_time_budget = False
         if budget_time and budget_time > 0:
             self.logger.info(f"Time budget is {budget_time} minutes")
 
+        # models are keyed by their ID only if every entry is an ID string
+        ids_only = all(isinstance(m, str) for m in model_library)
+
         for i, model in enumerate(model_library):
 
-            model_id = (
-                model
-                if (
-                    isinstance(model, str)
-                    and all(isinstance(m, str) for m in model_library)
-                )
-                else str(i)
-            )
+            model_id = model if ids_only else str(i)
             model_name = self._get_model_name(model)
 
             if isinstance(model, str):
@@ -747,7 +780,7 @@ class _SupervisedExperiment(_TabularExperiment):
 
             # run_time
             runtime_start = time.time()
-            total_runtime += (runtime_start - total_runtime_start) / 60
+            total_runtime = (runtime_start - total_runtime_start) / 60
             self.logger.info(f"Total runtime is {total_runtime} minutes")
             over_time_budget = (
                 budget_time and budget_time > 0 and total_runtime > budget_time
@@ -757,7 +790,6 @@ class _SupervisedExperiment(_TabularExperiment):
                     f"Total runtime {total_runtime} is over time budget by {total_runtime - budget_time}, breaking loop"
                 )
                 break
-            total_runtime_start = runtime_start
 
             """
             MONITOR UPDATE STARTS
@@ -785,7 +817,6 @@ class _SupervisedExperiment(_TabularExperiment):
                 probability_threshold=probability_threshold,
                 refit=False,
             )
-            results_columns_to_ignore = ["Object", "runtime", "cutoff"]
             if errors == "raise":
                 model, model_fit_time = self._create_model(**create_model_args)
                 model_results = self.pull(pop=True)
@@ -858,33 +889,20 @@ class _SupervisedExperiment(_TabularExperiment):
             compare_models_.insert(0, "Object", [model])
             compare_models_.insert(0, "runtime", runtime)
             compare_models_.index = [model_id]
-            if master_display is None:
-                master_display = compare_models_
-            else:
-                master_display = pd.concat(
-                    [master_display, compare_models_], ignore_index=False
-                )
-            master_display = master_display.round(round)
-            if self._ml_usecase != MLUsecase.TIME_SERIES:
-                master_display = master_display.sort_values(
-                    by=sort, ascending=sort_ascending
-                )
-            else:
-                master_display = master_display.sort_values(
-                    by=sort.upper(), ascending=sort_ascending
-                )
-
-            master_display_ = master_display.drop(
-                results_columns_to_ignore, axis=1, errors="ignore"
-            ).style.format(precision=round)
-            master_display_ = master_display_.set_properties(**{"text-align": "left"})
-            master_display_ = master_display_.set_table_styles(
-                [dict(selector="th", props=[("text-align", "left")])]
-            )
+            model_rows.append(compare_models_)
 
+            # Only rebuild the table per model when it is shown live
             if display.can_update_text:
+                master_display, master_display_ = self._build_master_display(
+                    model_rows, sort, sort_ascending, round, results_columns_to_ignore
+                )
                 display.display(master_display_, final_display=False)
 
+        if model_rows:
+            master_display, master_display_ = self._build_master_display(
+                model_rows, sort, sort_ascending, round, results_columns_to_ignore
+            )
+
         display.move_progress()
 
         compare_models_ = self._highlight_models(master_display_)
@@ -1092,21 +1110,11 @@ class _SupervisedExperiment(_TabularExperiment):
         MONITOR UPDATE ENDS
         """
 
-        from sklearn.model_selection import cross_validate
-
         metrics_dict = dict([(k, v.scorer) for k, v in metrics.items()])
 
         self.logger.info("Starting cross validation")
 
-        n_jobs = self.gpu_n_jobs_param
-        from sklearn.gaussian_process import (
-            GaussianProcessClassifier,
-            GaussianProcessRegressor,
-        )
-
-        # special case to prevent running out of memory
-        if isinstance(model, (GaussianProcessClassifier, GaussianProcessRegressor)):
-            n_jobs = 1
+        n_jobs = self._get_cv_n_jobs(model, self.gpu_n_jobs_param)
 
         with estimator_pipeline(self.pipeline, model) as pipeline_with_model:
             fit_kwargs = get_pipeline_fit_kwargs(pipeline_with_model, fit_kwargs)
@@ -1120,7 +1128,7 @@ class _SupervisedExperiment(_TabularExperiment):
                     data_y,
                     cv=cv,
                     groups=groups,
-                    scoring=metrics_dict,
+                    scoring=get_multimetric_scorer(pipeline_with_model, metrics_dict),
                     fit_params=fit_kwargs,
                     n_jobs=n_jobs,
                     return_train_score=return_train_score,
@@ -1129,52 +1137,36 @@ class _SupervisedExperiment(_TabularExperiment):
             model_fit_end = time.time()
             model_fit_time = np.array(model_fit_end - model_fit_start).round(2)
 
-            score_dict = {}
-            for k, v in metrics.items():
-                score_dict[v.display_name] = []
-                if return_train_score:
-                    train_score = scores[f"train_{k}"] * (
-                        1 if v.greater_is_better else -1
+            # cross_validate returns one entry per split actually run, no
+            # need to ask the splitter (which may re-split the data) again
+            fold = len(scores["fit_time"])
+
+            # Sign-corrected scores with one column per metric and one row per
+            # fold (train folds first), filled in place from cross_validate
+            splits = ["train", "test"] if return_train_score else ["test"]
+            fold_scores = np.empty((len(splits) * fold, len(metrics)))
+            for i, (k, v) in enumerate(metrics.items()):
+                sign = 1 if v.greater_is_better else -1
+                for j, split in enumerate(splits):
+                    fold_scores[j * fold : (j + 1) * fold, i] = (
+                        scores[f"{split}_{k}"] * sign
                     )
-                    train_score = train_score.tolist()
-                    score_dict[v.display_name] = train_score
-                test_score = scores[f"test_{k}"] * (1 if v.greater_is_better else -1)
-                test_score = test_score.tolist()
-                score_dict[v.display_name] += test_score
 
             self.logger.info("Calculating mean and std")
 
-            avgs_dict = {}
-            for k, v in metrics.items():
-                avgs_dict[v.display_name] = []
-                if return_train_score:
-                    train_score = scores[f"train_{k}"] * (
-                        1 if v.greater_is_better else -1
-                    )
-                    train_score = train_score.tolist()
-                    avgs_dict[v.display_name] = [
-                        np.mean(train_score),
-                        np.std(train_score),
-                    ]
-                test_score = scores[f"test_{k}"] * (1 if v.greater_is_better else -1)
-                test_score = test_score.tolist()
-                avgs_dict[v.display_name] += [np.mean(test_score), np.std(test_score)]
+            # Mean and std rows per split, in the same layout as fold_scores
+            split_scores = fold_scores.reshape(len(splits), fold, len(metrics))
+            avgs = np.stack(
+                [split_scores.mean(axis=1), split_scores.std(axis=1)], axis=1
+            ).reshape(-1, len(metrics))
+
+            metric_names = [v.display_name for v in metrics.values()]
+            avgs_dict = dict(zip(metric_names, avgs.T.tolist()))
 
             display.move_progress()
 
             self.logger.info("Creating metrics dataframe")
 
-            if hasattr(cv, "n_splits"):
-                fold = cv.n_splits
-            elif hasattr(cv, "get_n_splits"):
-                fold = cv.get_n_splits()
-            else:
-                raise ValueError(
-                    "The cross validation class should implement a n_splits "
-                    f"attribute or a get_n_splits method. {cv.__class__.__name__} "
-                    "has neither."
-                )
-
             if return_train_score:
                 model_results = pd.DataFrame(
                     {
@@ -1194,9 +1186,9 @@ class _SupervisedExperiment(_TabularExperiment):
                     }
                 )
 
-            model_scores = pd.concat(
-                [pd.DataFrame(score_dict), pd.DataFrame(avgs_dict)]
-            ).reset_index(drop=True)
+            model_scores = pd.DataFrame(
+                np.vstack([fold_scores, avgs]), columns=metric_names
+            )
 
             model_results = pd.concat([model_results, model_scores], axis=1)
             model_results.set_index(
@@ -1233,9 +1225,7 @@ class _SupervisedExperiment(_TabularExperiment):
 
                 model_fit_time = np.array(model_fit_end - model_fit_start).round(2)
             else:
-                model_fit_time /= self._get_cv_n_folds(
-                    cv, data_X, y=data_y, groups=groups
-                )
+                model_fit_time /= fold
 
         model_results = model_results.round(round)
 
@@ -1320,14 +1310,12 @@ class _SupervisedExperiment(_TabularExperiment):
         # run_time
         runtime_start = time.time()
 
-        available_estimators = set(self._all_models_internal.keys())
-
         if not fit_kwargs:
             fit_kwargs = {}
 
         # only raise exception of estimator is of type string.
         if isinstance(estimator, str):
-            if estimator not in available_estimators:
+            if estimator not in self._all_models_internal:
                 raise ValueError(
                     f"Estimator {estimator} not available. Please see docstring for list of available estimators."
                 )
@@ -1445,22 +1433,27 @@ class _SupervisedExperiment(_TabularExperiment):
 
         self.logger.info("Importing untrained model")
 
-        if isinstance(estimator, str) and estimator in available_estimators:
-            model_definition = self._all_models_internal[estimator]
-            model_args = model_definition.args
-            model_args = {**model_args, **kwargs}
-            model = model_definition.class_def(**model_args)
-            full_name = model_definition.name
-        else:
+        # estimator objects are the common case inside compare_models and the
+        # tuning / ensembling functions, so check for them first
+        if not isinstance(estimator, str):
             self.logger.info("Declaring custom model")
 
             model = clone(estimator)
-            model.set_params(**kwargs)
+            if kwargs:
+                model.set_params(**kwargs)
+                # workaround for an issue with set_params in cuML
+                model = clone(model)
 
             full_name = self._get_model_name(model)
+        else:
+            model_definition = self._all_models_internal[estimator]
+            model_args = model_definition.args
+            model_args = {**model_args, **kwargs}
+            model = model_definition.class_def(**model_args)
+            full_name = model_definition.name
 
-        # workaround for an issue with set_params in cuML
-        model = clone(model)
+            # workaround for an issue with set_params in cuML
+            model = clone(model)
 
         display.update_monitor(2, full_name)
 
@@ -1570,6 +1563,10 @@ class _SupervisedExperiment(_TabularExperiment):
         # storing results in _master_model_container
         if add_to_model_list:
             self.logger.info("Uploading model into container now")
+            # record the underlying splitter so automl can still recognise
+            # results obtained on the default folds
+            if isinstance(cv, PrecomputedSplits):
+                cv = cv.cv
             self._master_model_container.append(
                 {"model": model, "scores": model_results, "cv": cv}
             )
@@ -2004,14 +2001,13 @@ class _SupervisedExperiment(_TabularExperiment):
             raise TypeError("n_iter parameter only accepts integer value.")
 
         # checking early_stopping parameter
-        possible_early_stopping = ["asha", "Hyperband", "Median"]
-        if (
-            isinstance(early_stopping, str)
-            and early_stopping not in possible_early_stopping
-        ):
-            raise TypeError(
-                f"early_stopping parameter must be one of {', '.join(possible_early_stopping)}"
-            )
+        possible_early_stopping = ["asha", "hyperband", "median"]
+        if isinstance(early_stopping, str):
+            early_stopping = early_stopping.lower()
+            if early_stopping not in possible_early_stopping:
+                raise TypeError(
+                    f"early_stopping parameter must be one of {', '.join(possible_early_stopping)}"
+                )
 
         # checking early_stopping_max_iters parameter
         if type(early_stopping_max_iters) is not int:
@@ -2210,8 +2206,6 @@ class _SupervisedExperiment(_TabularExperiment):
             monitor_rows=monitor_rows,
         )
 
-        import logging
-
         np.random.seed(self.seed)
 
         self.logger.info("Copying training dataset")
@@ -2387,11 +2381,7 @@ class _SupervisedExperiment(_TabularExperiment):
             if custom_grid is not None:
                 self.logger.info(f"custom_grid: {param_grid}")
 
-            from sklearn.gaussian_process import GaussianProcessClassifier
-
-            # special case to prevent running out of memory
-            if isinstance(pipeline_with_model.steps[-1][1], GaussianProcessClassifier):
-                n_jobs = 1
+            n_jobs = self._get_cv_n_jobs(pipeline_with_model.steps[-1][1], n_jobs)
 
             self.logger.info(f"Tuning with n_jobs={n_jobs}")
 
@@ -3048,12 +3038,18 @@ class _SupervisedExperiment(_TabularExperiment):
         if method == "Bagging":
             self.logger.info("Ensemble method set to Bagging")
             bagging_model_definition = self._all_models_internal["Bagging"]
+            bagging_args = dict(bagging_model_definition.args)
+
+            # a base model already spreading over the cores would be
+            # oversubscribed by fitting the bagging members in parallel
+            if getattr(model, "n_jobs", None) not in (None, 1):
+                bagging_args["n_jobs"] = 1
 
             model = bagging_model_definition.class_def(
                 model,
                 bootstrap=True,
                 n_estimators=n_estimators,
-                **bagging_model_definition.args,
+                **bagging_args,
             )
 
         else:
@@ -5663,7 +5659,7 @@ class _SupervisedExperiment(_TabularExperiment):
     @property
     def y(self):
         """Target column."""
-        return self.dataset[self.target_param]
+        return self.data[self.target_param].copy()
 
     @property
     @abstractmethod
@@ -5691,12 +5687,12 @@ class _SupervisedExperiment(_TabularExperiment):
     @property
     def y_train(self):
         """Target column of the training set."""
-        return self.train[self.target_param]
+        return self.data.loc[self.idx[0], self.target_param]
 
     @property
     def y_test(self):
         """Target column of the test set."""
-        return self.test[self.target_param]
+        return self.data.loc[self.idx[1], self.target_param]
 
     @property
     @abstractmethod
@@ -4,18 +4,23 @@ import os
 import random
 import secrets
 import traceback
+from contextlib import nullcontext
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Tuple, Union
 from unittest.mock import patch
 
 import numpy as np  # type: ignore
 import pandas as pd
-import plotly.express as px  # type: ignore
-import scikitplot as skplt  # type: ignore
 from IPython.display import display as ipython_display
 from joblib.memory import Memory
 from packaging import version
 from pandas.io.formats.style import Styler
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.ensemble import BaseEnsemble
+from sklearn.gaussian_process import (
+    GaussianProcessClassifier,
+    GaussianProcessRegressor,
+)
 from sklearn.model_selection import BaseCrossValidator  # type: ignore
 from sklearn.pipeline import Pipeline
 
@@ -26,6 +31,7 @@ import pycaret.internal.preprocess
 import pycaret.loggers
 from pycaret.internal.display import CommonDisplay
 from pycaret.internal.logging import create_logger, get_logger, redirect_output
+from pycaret.internal.meta_estimators import get_estimator_from_meta_estimator
 from pycaret.internal.pipeline import Pipeline as InternalPipeline
 from pycaret.internal.pipeline import get_memory
 from pycaret.internal.plots.helper import MatplotlibDefaultDPI
@@ -42,6 +48,7 @@ from pycaret.utils.generic import (
     get_allowed_engines,
     get_label_encoder,
     get_model_name,
+    highlight_setup,
 )
 
 LOGGER = get_logger()
@@ -120,6 +127,24 @@ class _TabularExperiment(_PyCaretExperiment):
             else "kfold",
         )
 
+    def _get_cv_n_jobs(self, model, n_jobs: Optional[int]) -> Optional[int]:
+        """Number of jobs to fit the folds (or search candidates) of
+        ``model`` with, capping ``n_jobs`` where parallel fits would hurt."""
+        estimator = get_estimator_from_meta_estimator(model)
+
+        # special case to prevent running out of memory
+        if isinstance(estimator, (GaussianProcessClassifier, GaussianProcessRegressor)):
+            return 1
+
+        # sklearn ensembles and calibrators fit their own members with joblib.
+        # Loky workers only cap OpenMP/BLAS threads, so running those folds in
+        # parallel as well would oversubscribe the cores
+        if isinstance(estimator, (BaseEnsemble, CalibratedClassifierCV)):
+            if getattr(estimator, "n_jobs", None) not in (None, 1):
+                return 1
+
+        return n_jobs
+
     def _is_unsupervised(self) -> bool:
         return False
 
@@ -204,6 +229,25 @@ class _TabularExperiment(_PyCaretExperiment):
                 f"{traceback.format_exc()}"
             )
 
+    def _display_setup(self, container: List[List[Any]]):
+        """Store and display the setup summary."""
+        self._display_container = [
+            pd.DataFrame(container, columns=["Description", "Value"])
+        ]
+        self.logger.info(f"Setup _display_container: {self._display_container[0]}")
+        display = CommonDisplay(
+            verbose=self.verbose,
+            html_param=self.html_param,
+        )
+        if self.verbose:
+            summary = self._display_container[0]
+            # Only rich frontends render the Styler, the rest unwrap it
+            if display.can_update_rich:
+                summary = summary.style.apply(highlight_setup)
+            pd.set_option("display.max_rows", 100)
+            display.display(summary)
+            pd.reset_option("display.max_rows")  # Reset option
+
     def _profile(self, profile, profile_kwargs):
         """Create a profile report"""
         if profile:
@@ -610,6 +654,8 @@ class _TabularExperiment(_PyCaretExperiment):
                     return plot_filename
 
                 def cluster():
+                    import plotly.express as px
+
                     self.logger.info(
                         "SubProcess assign_model() called =================================="
                     )
@@ -704,6 +750,8 @@ class _TabularExperiment(_PyCaretExperiment):
                     return plot_filename
 
                 def umap():
+                    import plotly.express as px
+
                     self.logger.info(
                         "SubProcess assign_model() called =================================="
                     )
@@ -782,6 +830,8 @@ class _TabularExperiment(_PyCaretExperiment):
                         return _tsne_anomaly()
 
                 def _tsne_anomaly():
+                    import plotly.express as px
+
                     self.logger.info(
                         "SubProcess assign_model() called =================================="
                     )
@@ -861,6 +911,8 @@ class _TabularExperiment(_PyCaretExperiment):
                     return plot_filename
 
                 def _tsne_clustering():
+                    import plotly.express as px
+
                     self.logger.info(
                         "SubProcess assign_model() called =================================="
                     )
@@ -962,6 +1014,8 @@ class _TabularExperiment(_PyCaretExperiment):
                     return plot_filename
 
                 def distribution():
+                    import plotly.express as px
+
                     self.logger.info(
                         "SubProcess assign_model() called =================================="
                     )
@@ -1322,20 +1376,42 @@ class _TabularExperiment(_PyCaretExperiment):
 
                 def rfe():
 
+                    from joblib import parallel_backend
+                    from joblib.parallel import get_active_backend
                     from yellowbrick.model_selection import RFECV
 
                     visualizer = RFECV(estimator, cv=cv, groups=groups, **plot_kwargs)
+
+                    # RFECV cross-validates every feature subset without an
+                    # n_jobs argument, so the jobs are set on the active backend.
+                    # A multi-threaded estimator keeps RFECV serial and its own
+                    # backend hints (e.g. threads for the forests)
+                    n_jobs = self._get_cv_n_jobs(estimator, self.gpu_n_jobs_param)
+                    if n_jobs == 1:
+                        jobs_context = nullcontext()
+                    else:
+                        backend, _ = get_active_backend()
+                        jobs_context = parallel_backend(backend, n_jobs=n_jobs)
+
+                    self.logger.info("Fitting Model")
+                    with jobs_context:
+                        visualizer.fit(
+                            self.X_train_transformed,
+                            self.y_train_transformed,
+                            **fit_kwargs,
+                        )
+
                     return show_yellowbrick_plot(
                         visualizer=visualizer,
                         X_train=self.X_train_transformed,
                         y_train=self.y_train_transformed,
                         X_test=self.X_test_transformed,
                         y_test=self.y_test_transformed,
+                        handle_train="",
                         handle_test="",
                         name=plot_name,
                         scale=scale,
                         save=save,
-                        fit_kwargs=fit_kwargs,
                         display_format=display_format,
                     )
 
@@ -1343,14 +1419,16 @@ class _TabularExperiment(_PyCaretExperiment):
 
                     from yellowbrick.model_selection import LearningCurve
 
-                    sizes = np.linspace(0.3, 1.0, 10)
+                    # Each train size costs a full cross-validation,
+                    # pass fewer sizes through plot_kwargs to speed it up
+                    kwargs = {"train_sizes": np.linspace(0.3, 1.0, 10), **plot_kwargs}
                     visualizer = LearningCurve(
                         estimator,
                         cv=cv,
-                        train_sizes=sizes,
                         groups=groups,
                         n_jobs=self.gpu_n_jobs_param,
                         random_state=self.seed,
+                        **kwargs,
                     )
                     return show_yellowbrick_plot(
                         visualizer=visualizer,
@@ -1367,6 +1445,7 @@ class _TabularExperiment(_PyCaretExperiment):
                     )
 
                 def lift():
+                    import scikitplot as skplt
 
                     self.logger.info("Generating predictions / predict_proba on X_test")
                     y_test__ = self.y_test_transformed
@@ -1392,6 +1471,7 @@ class _TabularExperiment(_PyCaretExperiment):
                     return plot_filename
 
                 def gain():
+                    import scikitplot as skplt
 
                     self.logger.info("Generating predictions / predict_proba on X_test")
                     y_test__ = self.y_test_transformed
@@ -1905,6 +1985,7 @@ class _TabularExperiment(_PyCaretExperiment):
                     self.logger.info("Visual Rendered Successfully")
 
                 def ks():
+                    import scikitplot as skplt
 
                     self.logger.info("Generating predictions / predict_proba on X_test")
                     predict_proba__ = estimator.predict_proba(self.X_train_transformed)
@@ -30,7 +30,7 @@ from pycaret.internal.pycaret_experiment.tabular_experiment import _TabularExper
 from pycaret.internal.validation import is_sklearn_pipeline
 from pycaret.loggers.base_logger import BaseLogger
 from pycaret.utils.constants import DATAFRAME_LIKE, SEQUENCE_LIKE
-from pycaret.utils.generic import MLUsecase, highlight_setup, infer_ml_usecase
+from pycaret.utils.generic import MLUsecase, infer_ml_usecase
 
 LOGGER = get_logger()
 
@@ -547,6 +547,31 @@ class _UnsupervisedExperiment(_TabularExperiment, Preprocessor):
                         f"are: {', '.join(self._available_plots.keys())}."
                     )
 
+        # Validate the string options before touching the data
+        if preprocess:
+            # Only simple imputation is implemented for unsupervised setup
+            imputation_type = self._check_setup_param(
+                "imputation_type", imputation_type, allowed=("simple",)
+            )
+            if imputation_type == "simple":
+                numeric_imputation = self._check_setup_param(
+                    "numeric_imputation", numeric_imputation
+                )
+            if transformation:
+                transformation_method = self._check_setup_param(
+                    "transformation_method", transformation_method
+                )
+            if normalize:
+                normalize_method = self._check_setup_param(
+                    "normalize_method", normalize_method
+                )
+            if pca:
+                pca_method = self._check_setup_param("pca_method", pca_method)
+            if remove_outliers:
+                outliers_method = self._check_setup_param(
+                    "outliers_method", outliers_method
+                )
+
         # Set up data ============================================== >>
         if data_func is not None:
             data = data_func()
@@ -585,11 +610,6 @@ class _UnsupervisedExperiment(_TabularExperiment, Preprocessor):
             # Impute missing values
             if imputation_type == "simple":
                 self._simple_imputation(numeric_imputation, categorical_imputation)
-            elif imputation_type is not None:
-                raise ValueError(
-                    "Invalid value for the imputation_type parameter, got "
-                    f"{imputation_type}. Possible values are: simple."
-                )
 
             # Convert text features to meaningful vectors
             if self._fxs["Text"]:
@@ -664,8 +684,9 @@ class _UnsupervisedExperiment(_TabularExperiment, Preprocessor):
         for fx, cols in self._fxs.items():
             if len(cols) > 0:
                 container.append([f"{fx} features", len(cols)])
-        if self.data.isna().sum().sum():
-            n_nans = 100 * self.data.isna().any(axis=1).sum() / len(self.data)
+        rows_with_nans = self.data.isna().to_numpy().any(axis=1)
+        if rows_with_nans.any():
+            n_nans = 100 * rows_with_nans.mean()
             container.append(["Rows with missing values", f"{round(n_nans, 1)}%"])
         if preprocess:
             container.append(["Preprocess", preprocess])
@@ -711,18 +732,7 @@ class _UnsupervisedExperiment(_TabularExperiment, Preprocessor):
             container.append(["Experiment Name", self.exp_name_log])
             container.append(["USI", self.USI])
 
-        self._display_container = [
-            pd.DataFrame(container, columns=["Description", "Value"])
-        ]
-        self.logger.info(f"Setup _display_container: {self._display_container[0]}")
-        display = CommonDisplay(
-            verbose=self.verbose,
-            html_param=self.html_param,
-        )
-        if self.verbose:
-            pd.set_option("display.max_rows", 100)
-            display.display(self._display_container[0].style.apply(highlight_setup))
-            pd.reset_option("display.max_rows")  # Reset option
+        self._display_setup(container)
 
         # Wrap-up ================================================== >>
 
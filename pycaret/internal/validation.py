@@ -72,3 +72,24 @@ def supports_partial_fit(estimator, params: dict = None) -> bool:
         return hasattr(estimator.steps[-1][1], "partial_fit")
 
     return hasattr(estimator, "partial_fit")
+
+
+class PrecomputedSplits:
+    """
+    Cross-validator replaying the train/test splits of ``cv`` on the given
+    data, so several models can be evaluated on the exact same folds
+    without splitting the data again for each of them.
+    """
+
+    def __init__(self, cv, X, y=None, groups=None):
+        self.cv = cv
+        self.splits = list(cv.split(X, y, groups))
+
+    def split(self, X=None, y=None, groups=None):
+        yield from self.splits
+
+    def get_n_splits(self, X=None, y=None, groups=None):
+        return len(self.splits)
+
+    def __repr__(self):
+        return repr(self.cv)
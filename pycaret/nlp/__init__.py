@@ -1,5 +1,4 @@
 import os
-import sys
 from typing import Any, Dict, Optional
 
 import deprecation
@@ -122,8 +121,6 @@ def setup(
     """
 
     # exception checking
-    import sys
-
     from pycaret.utils import __version__
 
     ver = __version__
@@ -238,47 +235,33 @@ def setup(
     # checking data type
     if hasattr(data, "shape") is False:
         if type(data) is not list:
-            sys.exit(
-                "(Type Error): data passed must be of type pandas.DataFrame or list"
-            )
+            raise TypeError("data passed must be of type pandas.DataFrame or list")
 
     # if dataframe is passed then target is mandatory
     if hasattr(data, "shape"):
         if target is None:
-            sys.exit(
-                "(Type Error): When pandas.Dataframe is passed as data param. Target column containing text must be specified in target param."
+            raise TypeError(
+                "When pandas.Dataframe is passed as data param. Target column containing text must be specified in target param."
             )
 
     # checking target parameter
     if target is not None:
         if target not in data.columns:
-            sys.exit(
-                "(Value Error): Target parameter doesnt exist in the data provided."
-            )
+            raise ValueError("Target parameter doesnt exist in the data provided.")
 
     # custom stopwords checking
     if custom_stopwords is not None:
         if type(custom_stopwords) is not list:
-            sys.exit("(Type Error): custom_stopwords must be of list type.")
+            raise TypeError("custom_stopwords must be of list type.")
 
     # checking session_id
     if session_id is not None:
         if type(session_id) is not int:
-            sys.exit("(Type Error): session_id parameter must be an integer.")
-
-    # check if spacy is loaded
-    if _check_soft_dependencies("spacy", extra="nlp", severity="warning"):
-        import spacy
-
-        spacy.load("en_core_web_sm", disable=["parser", "ner"])
-    else:
-        sys.exit(
-            "(Type Error): spacy english model is not yet downloaded. See the documentation of setup to see installation guide."
-        )
+            raise TypeError("session_id parameter must be an integer.")
 
     # html
     if type(html) is not bool:
-        sys.exit("(Type Error): html parameter only accepts True or False.")
+        raise TypeError("html parameter only accepts True or False.")
 
     # log_experiment
     def validate_log_experiment(obj):
@@ -304,15 +287,30 @@ def setup(
 
     # log_plots
     if type(log_plots) is not bool:
-        sys.exit("(Type Error): log_plots parameter only accepts True or False.")
+        raise TypeError("log_plots parameter only accepts True or False.")
 
     # log_data
     if type(log_data) is not bool:
-        sys.exit("(Type Error): log_data parameter only accepts True or False.")
+        raise TypeError("log_data parameter only accepts True or False.")
 
     # verbose
     if type(verbose) is not bool:
-        sys.exit("(Type Error): verbose parameter only accepts True or False.")
+        raise TypeError("verbose parameter only accepts True or False.")
+
+    # check if spacy is loaded (last, loading the model is slow)
+    spacy_model_missing = (
+        "spacy english model is not yet downloaded. "
+        "Install it with: python -m spacy download en_core_web_sm"
+    )
+    if _check_soft_dependencies("spacy", extra="nlp", severity="warning"):
+        import spacy
+
+        try:
+            spacy.load("en_core_web_sm", disable=["parser", "ner"])
+        except OSError as e:
+            raise ImportError(spacy_model_missing) from e
+    else:
+        raise ImportError(spacy_model_missing)
 
     """
     error handling ends here
@@ -1123,34 +1121,30 @@ def create_model(
 
     # checking for model parameter
     if model is None:
-        sys.exit(
-            "(Value Error): Model parameter Missing. Please see docstring for list of available models."
+        raise ValueError(
+            "Model parameter Missing. Please see docstring for list of available models."
         )
 
     # checking for allowed models
     allowed_models = ["lda", "lsi", "hdp", "rp", "nmf"]
 
     if model not in allowed_models:
-        sys.exit(
-            "(Value Error): Model Not Available. Please see docstring for list of available models."
+        raise ValueError(
+            "Model Not Available. Please see docstring for list of available models."
         )
 
     # checking multicore type:
     if type(multi_core) is not bool:
-        sys.exit(
-            "(Type Error): multi_core parameter can only take argument as True or False."
-        )
+        raise TypeError("multi_core parameter can only take argument as True or False.")
 
     # checking round parameter
     if num_topics is not None:
         if num_topics <= 1:
-            sys.exit("(Type Error): num_topics parameter only accepts integer value.")
+            raise ValueError("num_topics must be greater than 1.")
 
     # checking verbose parameter
     if type(verbose) is not bool:
-        sys.exit(
-            "(Type Error): Verbose parameter can only take argument as True or False."
-        )
+        raise TypeError("Verbose parameter can only take argument as True or False.")
 
     # experiment custom tags
     if experiment_custom_tags is not None:
@@ -1554,15 +1548,13 @@ def assign_model(model, verbose=True):
     allowed_models = ["lda", "lsi", "hdp", "rp", "nmf"]
 
     if mod_type not in allowed_models:
-        sys.exit(
-            "(Value Error): Model Not Recognized. Please see docstring for list of available models."
+        raise ValueError(
+            "Model Not Recognized. Please see docstring for list of available models."
         )
 
     # checking verbose parameter
     if type(verbose) is not bool:
-        sys.exit(
-            "(Type Error): Verbose parameter can only take argument as True or False."
-        )
+        raise TypeError("Verbose parameter can only take argument as True or False.")
 
     """
     error handling ends here
@@ -1948,24 +1940,24 @@ def plot_model(
         "umap",
     ]
     if plot not in allowed_plots:
-        sys.exit(
-            "(Value Error): Plot Not Available. Please see docstring for list of available plots."
+        raise ValueError(
+            "Plot Not Available. Please see docstring for list of available plots."
         )
 
     # plots without topic model
     if model is None:
         not_allowed_wm = ["tsne", "topic_model", "topic_distribution"]
         if plot in not_allowed_wm:
-            sys.exit(
-                "(Type Error): Model parameter Missing. Plot not supported without specific model passed in as Model param."
+            raise TypeError(
+                "Model parameter Missing. Plot not supported without specific model passed in as Model param."
             )
 
     # handle topic_model plot error
     if plot == "topic_model":
         not_allowed_tm = ["lsi", "rp", "nmf"]
         if mod_type in not_allowed_tm:
-            sys.exit(
-                "(Type Error): Model not supported for plot = topic_model. Please see docstring for list of available models supported for topic_model."
+            raise TypeError(
+                "Model not supported for plot = topic_model. Please see docstring for list of available models supported for topic_model."
             )
 
     # checking display_format parameter
@@ -2110,8 +2102,8 @@ def plot_model(
             logger.warning(
                 "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
-            sys.exit(
-                "(Value Error): Invalid topic_num param or empty Vocab. Try changing Topic Number."
+            raise ValueError(
+                "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
 
     elif plot == "distribution":
@@ -2203,8 +2195,8 @@ def plot_model(
             logger.warning(
                 "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
-            sys.exit(
-                "(Value Error): Invalid topic_num param or empty Vocab. Try changing Topic Number."
+            raise ValueError(
+                "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
 
     elif plot == "bigram":
@@ -2322,8 +2314,8 @@ def plot_model(
             logger.warning(
                 "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
-            sys.exit(
-                "(Value Error): Invalid topic_num param or empty Vocab. Try changing Topic Number."
+            raise ValueError(
+                "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
 
     elif plot == "trigram":
@@ -2441,8 +2433,8 @@ def plot_model(
             logger.warning(
                 "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
-            sys.exit(
-                "(Value Error): Invalid topic_num param or empty Vocab. Try changing Topic Number."
+            raise ValueError(
+                "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
 
     elif plot == "sentiment":
@@ -2539,8 +2531,8 @@ def plot_model(
             logger.warning(
                 "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
-            sys.exit(
-                "(Value Error): Invalid topic_num param or empty Vocab. Try changing Topic Number."
+            raise ValueError(
+                "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
 
     elif plot == "pos":
@@ -2838,8 +2830,8 @@ def plot_model(
             logger.warning(
                 "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
-            sys.exit(
-                "(Value Error): Invalid topic_num param or empty Vocab. Try changing Topic Number."
+            raise ValueError(
+                "Invalid topic_num param or empty Vocab. Try changing Topic Number."
             )
 
     elif plot == "umap":
@@ -3056,27 +3048,23 @@ def tune_model(
 
     warnings.filterwarnings("ignore")
 
-    import sys
-
     # checking for model parameter
     if model is None:
-        sys.exit(
-            "(Value Error): Model parameter Missing. Please see docstring for list of available models."
+        raise ValueError(
+            "Model parameter Missing. Please see docstring for list of available models."
         )
 
     # checking for allowed models
     allowed_models = ["lda", "lsi", "hdp", "rp", "nmf"]
 
     if model not in allowed_models:
-        sys.exit(
-            "(Value Error): Model Not Available. Please see docstring for list of available models."
+        raise ValueError(
+            "Model Not Available. Please see docstring for list of available models."
         )
 
     # checking multicore type:
     if type(multi_core) is not bool:
-        sys.exit(
-            "(Type Error): multi_core parameter can only take argument as True or False."
-        )
+        raise TypeError("multi_core parameter can only take argument as True or False.")
 
     # check supervised target:
     if supervised_target is not None:
@@ -3084,8 +3072,8 @@ def tune_model(
         target = target_
         all_col.remove(target)
         if supervised_target not in all_col:
-            sys.exit(
-                "(Value Error): supervised_target not recognized. It can only be one of the following: "
+            raise ValueError(
+                "supervised_target not recognized. It can only be one of the following: "
                 + str(all_col)
             )
 
@@ -3094,8 +3082,8 @@ def tune_model(
         models_not_allowed = ["rp", "nmf"]
 
         if model in models_not_allowed:
-            sys.exit(
-                "(Type Error): Model not supported for unsupervised tuning. Either supervised_target param has to be passed or different model has to be used. Please see docstring for available models."
+            raise TypeError(
+                "Model not supported for unsupervised tuning. Either supervised_target param has to be passed or different model has to be used. Please see docstring for available models."
             )
 
     # checking estimator:
@@ -3144,8 +3132,8 @@ def tune_model(
         ]
 
         if estimator not in available_estimators:
-            sys.exit(
-                "(Value Error): Estimator Not Available. Please see docstring for list of available estimators."
+            raise ValueError(
+                "Estimator Not Available. Please see docstring for list of available estimators."
             )
 
     # checking optimize parameter
@@ -3166,19 +3154,17 @@ def tune_model(
         ]
 
         if optimize not in available_optimizers:
-            sys.exit(
-                "(Value Error): optimize parameter Not Available. Please see docstring for list of available parameters."
+            raise ValueError(
+                "optimize parameter Not Available. Please see docstring for list of available parameters."
             )
 
     # checking auto_fe:
     if type(auto_fe) is not bool:
-        sys.exit(
-            "(Type Error): auto_fe parameter can only take argument as True or False."
-        )
+        raise TypeError("auto_fe parameter can only take argument as True or False.")
 
     # checking fold parameter
     if type(fold) is not int:
-        sys.exit("(Type Error): Fold parameter only accepts integer value.")
+        raise TypeError("Fold parameter only accepts integer value.")
 
     """
     exception handling ends here
@@ -4339,8 +4325,6 @@ def get_logs(experiment_name=None, save=False):
 
     """
 
-    import sys
-
     if experiment_name is None:
         exp_name_log_ = exp_name_log
     else:
@@ -4352,7 +4336,7 @@ def get_logs(experiment_name=None, save=False):
     client = MlflowClient()
 
     if client.get_experiment_by_name(exp_name_log_) is None:
-        sys.exit(
+        raise ValueError(
             "No active run found. Check logging parameter in setup or to get logs for inactive run pass experiment_name."
         )
 
@@ -1625,6 +1625,7 @@ def plot_model(
     plot_kwargs: dict, default = {} (empty dict)
         Dictionary of arguments passed to the visualizer class.
             - pipeline: fontsize -> int
+            - learning: train_sizes -> array-like
 
 
     plot_kwargs: dict, default = {} (empty dict)
@@ -13,7 +13,6 @@ from pycaret.containers.models.regression import (
     ALL_ALLOWED_ENGINES,
     get_container_default_engines,
 )
-from pycaret.internal.display import CommonDisplay
 from pycaret.internal.logging import get_logger
 from pycaret.internal.parallel.parallel_backend import ParallelBackend
 
@@ -25,7 +24,7 @@ from pycaret.internal.pycaret_experiment.non_ts_supervised_experiment import (
 )
 from pycaret.loggers.base_logger import BaseLogger
 from pycaret.utils.constants import DATAFRAME_LIKE, SEQUENCE_LIKE, TARGET_LIKE
-from pycaret.utils.generic import MLUsecase, highlight_setup
+from pycaret.utils.generic import MLUsecase
 
 LOGGER = get_logger()
 
@@ -57,16 +56,10 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
         }
 
     def _get_models(self, raise_errors: bool = True) -> Tuple[dict, dict]:
-        all_models = {
-            k: v
-            for k, v in get_all_reg_model_containers(
-                self, raise_errors=raise_errors
-            ).items()
-            if not v.is_special
-        }
         all_models_internal = get_all_reg_model_containers(
             self, raise_errors=raise_errors
         )
+        all_models = {k: v for k, v in all_models_internal.items() if not v.is_special}
         return all_models, all_models_internal
 
     def _get_metrics(self, raise_errors: bool = True) -> dict:
@@ -698,13 +691,37 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
                         f"are: {', '.join(self._available_plots.keys())}."
                     )
 
-        # Check transform_target_method
-        allowed_transform_target_method = ["quantile", "yeo-johnson"]
-        if transform_target_method not in allowed_transform_target_method:
-            raise ValueError(
-                "Invalid value for the transform_target_method parameter. "
-                f"Choose from: {', '.join(allowed_transform_target_method)}."
+        # Validate the string options before touching the data
+        fold_strategy = self._check_setup_param("fold_strategy", fold_strategy)
+        transform_target_method = self._check_setup_param(
+            "transform_target_method", transform_target_method
+        )
+        if preprocess:
+            imputation_type = self._check_setup_param(
+                "imputation_type", imputation_type
             )
+            if imputation_type == "simple":
+                numeric_imputation = self._check_setup_param(
+                    "numeric_imputation", numeric_imputation
+                )
+            if transformation:
+                transformation_method = self._check_setup_param(
+                    "transformation_method", transformation_method
+                )
+            if normalize:
+                normalize_method = self._check_setup_param(
+                    "normalize_method", normalize_method
+                )
+            if pca:
+                pca_method = self._check_setup_param("pca_method", pca_method)
+            if remove_outliers:
+                outliers_method = self._check_setup_param(
+                    "outliers_method", outliers_method
+                )
+            if feature_selection:
+                feature_selection_method = self._check_setup_param(
+                    "feature_selection_method", feature_selection_method
+                )
         self.transform_target_param = transform_target
         self.transform_target_method = transform_target_method
 
@@ -780,11 +797,6 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
                     numeric_iterative_imputer=numeric_iterative_imputer,
                     categorical_iterative_imputer=categorical_iterative_imputer,
                 )
-            elif imputation_type is not None:
-                raise ValueError(
-                    "Invalid value for the imputation_type parameter, got "
-                    f"{imputation_type}. Possible values are: simple, iterative."
-                )
 
             # Convert text features to meaningful vectors
             if self._fxs["Text"]:
@@ -860,19 +872,32 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
 
         self.logger.info("Creating final display dataframe.")
 
+        # Transform every set only once (dataset = train + test)
+        train_transformed = self.train_transformed
+        test_transformed = self.test_transformed
+
         container = []
         container.append(["Session id", self.seed])
         container.append(["Target", self.target_param])
         container.append(["Target type", "Regression"])
         container.append(["Original data shape", self.data.shape])
-        container.append(["Transformed data shape", self.dataset_transformed.shape])
-        container.append(["Transformed train set shape", self.train_transformed.shape])
-        container.append(["Transformed test set shape", self.test_transformed.shape])
+        container.append(
+            [
+                "Transformed data shape",
+                (
+                    len(train_transformed) + len(test_transformed),
+                    train_transformed.shape[1],
+                ),
+            ]
+        )
+        container.append(["Transformed train set shape", train_transformed.shape])
+        container.append(["Transformed test set shape", test_transformed.shape])
         for fx, cols in self._fxs.items():
             if len(cols) > 0:
                 container.append([f"{fx} features", len(cols)])
-        if self.data.isna().sum().sum():
-            n_nans = 100 * self.data.isna().any(axis=1).sum() / len(self.data)
+        rows_with_nans = self.data.isna().to_numpy().any(axis=1)
+        if rows_with_nans.any():
+            n_nans = 100 * rows_with_nans.mean()
             container.append(["Rows with missing values", f"{round(n_nans, 1)}%"])
         if preprocess:
             container.append(["Preprocess", preprocess])
@@ -946,18 +971,7 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
             container.append(["Experiment Name", self.exp_name_log])
             container.append(["USI", self.USI])
 
-        self._display_container = [
-            pd.DataFrame(container, columns=["Description", "Value"])
-        ]
-        self.logger.info(f"Setup _display_container: {self._display_container[0]}")
-        display = CommonDisplay(
-            verbose=self.verbose,
-            html_param=self.html_param,
-        )
-        if self.verbose:
-            pd.set_option("display.max_rows", 100)
-            display.display(self._display_container[0].style.apply(highlight_setup))
-            pd.reset_option("display.max_rows")  # Reset option
+        self._display_setup(container)
 
         # Wrap-up ================================================== >>
 
@@ -1925,6 +1939,7 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
         plot_kwargs: dict, default = {} (empty dict)
             Dictionary of arguments passed to the visualizer class.
                 - pipeline: fontsize -> int
+                - learning: train_sizes -> array-like
 
 
         plot_kwargs: dict, default = {} (empty dict)
@@ -2824,10 +2839,8 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
 
         # Replaceing chars which dash doesnt accept for column name `.` , `{`, `}`
         X_test_df = self.X_test_transformed.copy()
-        X_test_df.columns = [
-            col.replace(".", "__").replace("{", "__").replace("}", "__")
-            for col in X_test_df.columns
-        ]
+        table = str.maketrans({".": "__", "{": "__", "}": "__"})
+        X_test_df.columns = [col.translate(table) for col in X_test_df.columns]
         explainer = RegressionExplainer(
             estimator, X_test_df, self.y_test_transformed, **kwargs
         )
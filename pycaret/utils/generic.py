@@ -380,14 +380,8 @@ def get_model_id(
 ) -> str:
     from pycaret.internal.meta_estimators import get_estimator_from_meta_estimator
 
-    return next(
-        (
-            k
-            for k, v in all_models.items()
-            if v.is_estimator_equal(get_estimator_from_meta_estimator(e))
-        ),
-        None,
-    )
+    e = get_estimator_from_meta_estimator(e)
+    return next((k for k, v in all_models.items() if v.is_estimator_equal(e)), None)
 
 
 def get_model_name(
@@ -403,7 +397,8 @@ def get_model_name(
         if deep:
             while hasattr(e, "get_params"):
                 old_e = e
-                params = e.get_params()
+                # only the top-level wrapped estimator is looked up here
+                params = e.get_params(deep=False)
                 if "steps" in params:
                     e = params["steps"][-1][1]
                 elif "base_estimator" in params:
@@ -7,6 +7,8 @@ Description: Unit tests for pipeline.py
 
 """
 
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -14,11 +16,12 @@ from imblearn.over_sampling import ADASYN
 from scipy.sparse import csr_matrix
 from sklearn.decomposition import PCA
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
 
 import pycaret.classification
 import pycaret.datasets
 import pycaret.regression
+from pycaret.internal.preprocess.preprocessor import Preprocessor
 
 
 def test_select_target_by_index():
@@ -300,6 +303,30 @@ def test_normalize(normalize_method):
     assert X["WeekofPurchase"].max() < 5
 
 
+def test_invalid_setup_option():
+    """Assert that an invalid string option raises before processing the data."""
+    data = pycaret.datasets.get_data("juice")
+    with patch.object(Preprocessor, "_normalization") as normalization:
+        with pytest.raises(ValueError, match=r".*normalize_method parameter.*"):
+            pycaret.classification.setup(
+                data=data,
+                normalize=True,
+                normalize_method="invalid",
+            )
+        normalization.assert_not_called()
+
+
+def test_setup_option_case():
+    """Assert that string options are case insensitive."""
+    data = pycaret.datasets.get_data("juice")
+    pc = pycaret.classification.setup(
+        data=data,
+        normalize=True,
+        normalize_method="MinMax",
+    )
+    assert isinstance(pc.pipeline.named_steps["normalize"].transformer, MinMaxScaler)
+
+
 def test_low_variance_threshold():
     """Assert that features with low variance are dropped."""
     data = pycaret.datasets.get_data("juice")
@@ -110,5 +110,36 @@ def test_regression_tuning():
     assert 1 == 1
 
 
+@pytest.mark.parametrize("early_stopping", ["hyperband", "Hyperband", "median"])
+def test_regression_tuning_optuna_pruners(early_stopping):
+    pytest.importorskip("optuna")
+
+    # loading dataset
+    data = pycaret.datasets.get_data("boston")
+
+    # init setup
+    exp = pycaret.regression.RegressionExperiment()
+    exp.setup(
+        data,
+        target="medv",
+        fold=2,
+        html=False,
+        session_id=123,
+        n_jobs=1,
+        verbose=False,
+    )
+
+    model = exp.create_model("par", verbose=False)
+    tuned_model = exp.tune_model(
+        model,
+        n_iter=2,
+        search_library="optuna",
+        search_algorithm="tpe",
+        early_stopping=early_stopping,
+        verbose=False,
+    )
+    assert hasattr(tuned_model, "predict")
+
+
 if __name__ == "__main__":
     test_regression_tuning()